@@ -3,28 +3,63 @@
 #imports
 import xmltodict
 import argparse
+import functools
+import hashlib
 import logging
+import os
 import socket
-import sys
 import requests
-from typing import List
+from requests.adapters import HTTPAdapter, Retry
+from typing import List, Tuple
 from datetime import datetime, timezone
 import calendar
 import math
+import numpy as np
 import time
 from astropy import coordinates
 from astropy import units
 from astropy.time import Time
 from flask import Flask, request
+from flask.json.provider import DefaultJSONProvider
+import orjson
 from geopy.geocoders import Nominatim
 
 #Global variables / constants
 app = Flask(__name__)
 
+ISS_DATA_URL = 'https://nasa-public-data.s3.amazonaws.com/iss-coords/current/ISS_OEM/ISS.OEM_J2K_EPH.xml'
+CACHE_TTL = 120
+SHM_CACHE_PATH = '/dev/shm/iss_tracker_cache.npz'
+
+_cache = {'data': None, 'state_vectors': None, 'header': None, 'metadata': None, 'comment': None,
+          'epoch_seconds': None, 'epoch_to_index': None,
+          'velocities': None, 'positions': None, 'speeds': None, 'epochs_json': None, 'epochs_etag': None,
+          'lat': None, 'lon': None, 'alt': None, 'etag': None, 'last_modified': None, 'ts': 0}
+
+_session = requests.Session()
+_session.mount('https://', HTTPAdapter(pool_connections=4, pool_maxsize=8,
+                                       max_retries=Retry(total=3, backoff_factor=0.2)))
+
+_geocoder = Nominatim(user_agent='iss_tracker')
+
 #Class definitions
+class ORJSONProvider(DefaultJSONProvider):
+    """
+    A JSON provider that serializes flask responses with orjson instead of the standard
+    library's json module. The /epochs route can return thousands of nested dictionaries,
+    so the faster encoder makes a real difference there. Numpy scalars are serialized
+    natively so values pulled out of the cached arrays need no conversion first.
+    """
+    def dumps(self, obj, **kwargs):
+        return(orjson.dumps(obj, option=orjson.OPT_SERIALIZE_NUMPY).decode())
+
+    def loads(self, s, **kwargs):
+        return(orjson.loads(s))
+
+app.json = ORJSONProvider(app)
 
 #Function definitions
-def get_capping_data(a_list_of_dicts: List[dict], a_key_string: str) -> List[str]:
+def get_capping_data(a_list_of_dicts: List[dict], a_key_string: str) -> Tuple[str, str]:
     """
     When fed the data in NASA's ISS data format, the function will find the top and bottom entries.
     These entries are considered the first and last portions of the data set.
@@ -36,15 +71,13 @@ def get_capping_data(a_list_of_dicts: List[dict], a_key_string: str) -> List[str
         a_key_string (str): A key that appears in each dictionary associated with the desired value.
                       String type will be enforced.
 
-    Returns: 
-           capping_data (List): A list of the data in a given key 'capping' the top and bottom of the dataset.
+    Returns:
+           capping_data (tuple): A tuple of the data in a given key 'capping' the top and bottom of the dataset.
     """
     try:
-        capping_data = []
-        capping_data.append(a_list_of_dicts['ndm']['oem']['body']['segment']['data']['stateVector'][0][a_key_string])
-        capping_data.append(a_list_of_dicts['ndm']['oem']['body']['segment']['data']['stateVector'][-1][a_key_string])
-        return(capping_data)
-    except:
+        state_vectors = a_list_of_dicts['ndm']['oem']['body']['segment']['data']['stateVector']
+        return((state_vectors[0][a_key_string], state_vectors[-1][a_key_string]))
+    except (KeyError, IndexError, TypeError):
         logging.error('Unable to fetch capping data. Aborting operation.')
         pass
 
@@ -60,27 +93,32 @@ def convert_iso_dis_8601(standard_time: str) -> str:
            converted_time (str): A set of temporal coordinates in ISO/DIS 8601 modified format.
     """
     try:
-        time_split = standard_time.split('T')
-        convert_sec = time_split[0].split('-')
-        
-        days_per_month = [31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31]
-        month = int(convert_sec[1])
-
-        if(int(convert_sec[0])%4==0):
-            days_per_month[1] = 29
-        
-        days = sum(days_per_month[:month-1], int(convert_sec[2]))
-        
-        days_string = str(days)
-        while len(days_string) < 3:
-            days_string = "0" + days_string
-        
-        converted_time = convert_sec[0] + '-' + days_string + 'T' + time_split[1]
+        head = standard_time
+        suffix = ''
+        if(head[-1] in 'zZ'):
+            suffix = head[-1]
+            head = head[:-1]
+        converted_time = datetime.fromisoformat(head).strftime('%Y-%jT%H:%M:%S.%f')[:-3] + suffix
         return(converted_time)
-    except:
+    except (IndexError, TypeError, ValueError):
         logging.error('Unable to convert time format. Aborting operation.')
         pass
 
+@functools.lru_cache(maxsize=1)
+def _workable_time_for_bucket(minute_bucket: int) -> str:
+    """
+    Converts the current time for a given minute bucket. The result is memoized on the bucket,
+    so every call inside the same minute reuses one conversion. The data set only has
+    per-minute granularity anyway, so nothing finer is ever needed.
+
+    Args:
+        minute_bucket (int): The current time floored to whole minutes.
+
+    Returns:
+           workable_time (str): The current time in ISS-workable ISO modified format.
+    """
+    return(convert_iso_dis_8601(datetime.now().isoformat()))
+
 def get_workable_time() -> str:
     """
     Uses datetime to get the current time at the running of the program.
@@ -90,16 +128,109 @@ def get_workable_time() -> str:
            workable_time (str): The current time in ISS-workable ISO modified format.
     """
     try:
-        current_time = datetime.now()
-        
-        iso_time = current_time.isoformat()
-        
-        workable_time = convert_iso_dis_8601(iso_time)
+        workable_time = _workable_time_for_bucket(int(time.time() // 60))
         return(workable_time)
-    except:
+    except (TypeError, ValueError):
         logging.error('Unable to get and convert current time. Aborting operation.')
         pass
 
+def _parse_modified_iso_to_epoch(epoch_str: str) -> int:
+    """
+    Converts a set of temporal coordinates in ISS-workable ISO modified format (such as
+    '2024-067T08:28:00.000Z') into integer seconds since the Unix epoch, so that timestamps
+    can be compared as plain integers rather than by splitting strings.
+
+    Args:
+        epoch_str (str): A temporal coordinate in ISO/DIS 8601 modified format.
+
+    Returns:
+           seconds (int): The equivalent number of seconds since the Unix epoch.
+    """
+    head = epoch_str.rstrip('zZ').split('.')[0]
+    return(calendar.timegm(time.strptime(head, '%Y-%jT%H:%M:%S')))
+
+def _epoch_strings_to_seconds(epochs: List[str]) -> np.ndarray:
+    """
+    Converts a whole batch of timestamps in ISS-workable ISO modified format into an int64
+    array of seconds since the Unix epoch. The strings share a fixed 'YYYY-DDDTHH:MM:SS'
+    layout, so the digits are pulled out of the entire batch with array arithmetic in one
+    pass instead of calling strptime once per entry. The first and last results are checked
+    against the per-string parser, and any batch that does not convert cleanly falls back
+    to the per-string loop.
+
+    Args:
+        epochs (List): The timestamps to be converted.
+
+    Returns:
+           seconds (np.ndarray): The equivalent seconds since the Unix epoch for each entry.
+    """
+    try:
+        arr = np.asarray(epochs, dtype=np.str_)
+        width = arr.dtype.itemsize // 4
+        if(arr.ndim != 1 or len(arr) == 0 or width < 17):
+            raise ValueError('epoch batch is not uniform')
+        digits = arr.view(np.uint32).reshape(len(arr), width).astype(np.int64) - ord('0')
+        year = digits[:,0]*1000 + digits[:,1]*100 + digits[:,2]*10 + digits[:,3]
+        doy = digits[:,5]*100 + digits[:,6]*10 + digits[:,7]
+        seconds_of_day = (digits[:,9]*10 + digits[:,10])*3600 + (digits[:,12]*10 + digits[:,13])*60 + digits[:,15]*10 + digits[:,16]
+        year_start = (year - 1970).astype('datetime64[Y]').astype('datetime64[s]').astype(np.int64)
+        seconds = year_start + (doy - 1)*86400 + seconds_of_day
+        if(int(seconds[0]) != _parse_modified_iso_to_epoch(str(arr[0])) or int(seconds[-1]) != _parse_modified_iso_to_epoch(str(arr[-1]))):
+            raise ValueError('epoch batch did not convert cleanly')
+        return(seconds)
+    except (TypeError, ValueError):
+        logging.info('Unable to convert epoch batch in bulk. Falling back to per-string parsing.')
+        return(np.array([_parse_modified_iso_to_epoch(e) for e in epochs], dtype=np.int64))
+
+def _epoch_keys_for(data: List[dict]) -> List[int]:
+    """
+    Returns the sorted list of integer epoch keys matching the given state vector list. The
+    cached data set reuses the keys built at cache-refresh time; any other list has its keys
+    computed on the spot.
+
+    Args:
+        data (List): A list of dictionaries in the ISS format.
+
+    Returns:
+           keys (List): The epoch of each state vector as integer seconds.
+    """
+    if(data is _cache['state_vectors'] and _cache['epoch_seconds'] is not None):
+        return(_cache['epoch_seconds'])
+    return(_epoch_strings_to_seconds([sv['EPOCH'] for sv in data]))
+
+def _find_epoch_index(data: List[dict], epoch: str) -> int:
+    """
+    Finds the index of the state vector whose timestamp lies closest to the given epoch.
+    The search runs as a bisect over precomputed integer epoch keys, so it takes O(log n)
+    instead of scanning the entire data set.
+
+    Args:
+        data (List): The data containing epochs to be parsed.
+        epoch (str): The epoch to be located.
+
+    Returns:
+           epoch_index (int): The index of the closest state vector, or -1 on failure.
+    """
+    if(data is _cache['state_vectors'] and _cache['epoch_to_index'] != None):
+        epoch_index = _cache['epoch_to_index'].get(epoch)
+        if(epoch_index != None):
+            return(epoch_index)
+    try:
+        target = _parse_modified_iso_to_epoch(epoch)
+    except ValueError:
+        logging.error('Failed to fetch epoch data. Aborting operation.')
+        return(-1)
+    keys = _epoch_keys_for(data)
+    if(len(keys) == 0):
+        logging.error('Failed to fetch epoch data. Aborting operation.')
+        return(-1)
+    epoch_index = int(np.searchsorted(keys, target))
+    if(epoch_index == len(keys)):
+        epoch_index -= 1
+    elif(epoch_index > 0 and target - keys[epoch_index-1] <= keys[epoch_index] - target):
+        epoch_index -= 1
+    return(epoch_index)
+
 def fetch_epoch_data(data: List[dict], epoch: str) -> List[dict]:
     """
     Takes an epoch as an argument and parses the ISS data set for the closest timestamp.
@@ -112,26 +243,10 @@ def fetch_epoch_data(data: List[dict], epoch: str) -> List[dict]:
     Returns:
            epoch_data (List): The associated data with the given epoch.
     """
-    try:
-        src_fragments = epoch.split(':')
-        closeness = 77
-        epoch_index = -1
-        match_found = False
-        for i, ele in enumerate(data):
-            comp_fragments = data[i]['EPOCH'].split(':')
-            if (src_fragments[0] == comp_fragments[0]):
-                comp_closeness = abs(int(src_fragments[1]) - int(comp_fragments[1]))
-                if (closeness > comp_closeness):
-                    closeness = comp_closeness
-                    epoch_index = i
-                    match_found = True
-        if (match_found==False):
-            logging.error('Failed to fetch epoch data. Aborting Operation.')
-            return([])
-        return(data[epoch_index])
-    except:
-        logging.error('Failed to fetch epoch data. Aborting operation.')
-        pass
+    epoch_index = _find_epoch_index(data, epoch)
+    if(epoch_index == -1):
+        return([])
+    return(data[epoch_index])
 
 def cartesian_velocity_to_speed(x_dot: float, y_dot: float, z_dot: float) -> float:
     """
@@ -146,16 +261,94 @@ def cartesian_velocity_to_speed(x_dot: float, y_dot: float, z_dot: float) -> flo
     Returns:
            speed (float): The absolute speed.
     """
-    try:
-        return(math.sqrt(x_dot**2 + y_dot**2 + z_dot**2))
-    except:
-        logging.error('Unable to convert cartesian velocity. Aborting operation.')
-        pass
+    return(math.hypot(x_dot, y_dot, z_dot))
+
+def _extract_components(data: List[dict], component_keys: tuple) -> np.ndarray:
+    """
+    Pulls a set of cartesian components out of a list of dictionaries in the ISS format and
+    lays them out as a contiguous (N,3) float64 array, so that downstream computations can
+    run as vectorized numpy passes instead of per-element Python loops. Incomputable entries
+    are kept as NaN rows so indices still line up with the state vector list.
+
+    Args:
+        data (List): A list of dictionaries in ISS format.
+        component_keys (tuple): The three keys to extract, such as ('X', 'Y', 'Z').
+
+    Returns:
+           components (np.ndarray): An (N,3) array of the extracted values.
+    """
+    rows = []
+    for sv in data:
+        try:
+            rows.append(tuple(float(sv[key]['#text']) for key in component_keys))
+        except (KeyError, TypeError, ValueError):
+            logging.info('Encountered incomputable value while extracting components. Omitting.')
+            rows.append((math.nan,) * len(component_keys))
+    return(np.array(rows, dtype=np.float64).reshape(len(rows), len(component_keys)))
+
+def _extract_velocities(data: List[dict]) -> np.ndarray:
+    """
+    Lays the cartesian velocities of a list of dictionaries in the ISS format out as a
+    contiguous (N,3) float64 array.
+
+    Args:
+        data (List): A list of dictionaries in ISS format.
+
+    Returns:
+           velocities (np.ndarray): An (N,3) array of x, y, and z velocities.
+    """
+    return(_extract_components(data, ('X_DOT', 'Y_DOT', 'Z_DOT')))
+
+def _extract_positions(data: List[dict]) -> np.ndarray:
+    """
+    Lays the cartesian positions of a list of dictionaries in the ISS format out as a
+    contiguous (N,3) float64 array.
+
+    Args:
+        data (List): A list of dictionaries in ISS format.
+
+    Returns:
+           positions (np.ndarray): An (N,3) array of x, y, and z positions.
+    """
+    return(_extract_components(data, ('X', 'Y', 'Z')))
+
+def _velocities_for(data: List[dict]) -> np.ndarray:
+    """
+    Returns the (N,3) velocity array matching the given state vector list. The cached data set
+    reuses the array built at cache-refresh time; any other list is extracted on the spot.
+
+    Args:
+        data (List): A list of dictionaries in ISS format.
+
+    Returns:
+           velocities (np.ndarray): An (N,3) array of x, y, and z velocities.
+    """
+    if(data is _cache['state_vectors'] and _cache['velocities'] is not None):
+        return(_cache['velocities'])
+    return(_extract_velocities(data))
+
+def _speeds_for(data: List[dict]) -> np.ndarray:
+    """
+    Returns the array of absolute speeds matching the given state vector list. The cached data
+    set reuses the speeds computed once at cache-refresh time; any other list has its speeds
+    computed on the spot from the velocity array.
+
+    Args:
+        data (List): A list of dictionaries in ISS format.
+
+    Returns:
+           speeds (np.ndarray): The absolute speed of each state vector.
+    """
+    if(data is _cache['state_vectors'] and _cache['speeds'] is not None):
+        return(_cache['speeds'])
+    velocities = _velocities_for(data)
+    return(np.sqrt(np.einsum('ij,ij->i', velocities, velocities)))
 
 def compute_average_speed(data: List[dict]) -> float:
     """
     Takes a list of dictionaries in the ISS format and returns the average speed
-    across all timestamps in the list.
+    across all timestamps in the list. The computation runs as a single vectorized
+    numpy pass over the velocity array rather than a Python loop.
 
     Args:
         data (List): A list of dictionaries in ISS format.
@@ -163,25 +356,13 @@ def compute_average_speed(data: List[dict]) -> float:
     Returns:
            average_speed (float): The average speed across the entire list.
     """
-    try:
-        running_avg = 0
-        avg_members = 0
-        for i, ele in enumerate(data):
-            try:
-                x_dot = float(data[i]['X_DOT']['#text'])
-                y_dot = float(data[i]['Y_DOT']['#text'])
-                z_dot = float(data[i]['Z_DOT']['#text'])
-                
-                running_avg += cartesian_velocity_to_speed(x_dot,y_dot,z_dot)
-                avg_members += 1
-            except:
-                logging.info('Encountered incomputable value while computing average. Omitting.')
-                pass
-        average = running_avg/avg_members
-        return(average)
-    except:
+    velocities = _velocities_for(data)
+    speeds = np.sqrt(np.einsum('ij,ij->i', velocities, velocities))
+    speeds = speeds[np.isfinite(speeds)]
+    if(speeds.size == 0):
         logging.error('Unable to complete computation of averge speed. Aborting operation.')
-        pass
+        return(None)
+    return(float(speeds.mean()))
 
 def fetch_index_request(data: List[dict], offset=None, limit=None) -> List[dict]:
     """
@@ -192,7 +373,8 @@ def fetch_index_request(data: List[dict], offset=None, limit=None) -> List[dict]
     Args:
         data (List): A list of dictionaries in the ISS format.
         limit (None): An optional modifier to the returned dataset. Will be taken as a string.
-                      The modifier in question sets a limit of the index range that will be returned.
+                      The modifier in question sets the maximum number of entries that will be
+                      returned, counted from the offset.
                       If an improper value or no value is supplied, defaults to the entire dataset.
         offset (None): An optional modifier to the returned dataset. Will be taken as a string.
                        The modifier in question sets a starting point from 0 of the returned data.
@@ -200,36 +382,186 @@ def fetch_index_request(data: List[dict], offset=None, limit=None) -> List[dict]
     Returns:
            requested (List): A list of dictionaries from the data adhering to the arguments.
     """
-    requested = []
     try:
         int_limit = int(limit)
-    except:
+    except (TypeError, ValueError):
         logging.info('Cannot convert limit to type: int. Disregarded.')
-        int_limit = len(data)
+        int_limit = None
     try:
         int_offset = int(offset)
-    except:
+    except (TypeError, ValueError):
         logging.info('Cannot convert offset to type: int. Disregarded.')
-        int_offset = 0    
-    for i in data[int_offset:int_limit]:
-        requested.append(i)
-    return(requested)
+        int_offset = 0
+    if(int_limit == None):
+        return(data[int_offset:])
+    return(data[int_offset:int_offset+int_limit])
+
+def _parse_oem_stream(stream) -> dict:
+    """
+    Parses an ISS OEM XML stream with xmltodict's streaming mode rather than building the whole
+    document tree in one go. Items are collected as they close (the header fields and the one
+    'segment' element that holds everything else) and the thin outer skeleton of the document
+    is rebuilt afterwards, so the parser never has to hold the full tree plus the skeleton.
+
+    Args:
+        stream: A file-like object yielding the OEM XML.
+
+    Returns:
+           data (dict): The ISS positional data in the same shape a full parse would produce.
+    """
+    sections = {'header': {}, 'segment': None}
+
+    def _collect(path, item):
+        name = path[-1][0]
+        if(name == 'segment'):
+            sections['segment'] = item
+        elif(path[2][0] == 'header'):
+            sections['header'][name] = item
+        return(True)
+
+    xmltodict.parse(stream, item_depth=4, item_callback=_collect)
+    data = {'ndm': {'oem': {'header': sections['header'], 'body': {'segment': sections['segment']}}}}
+    return(data)
+
+def _save_shared_cache() -> None:
+    """
+    Persists the freshly filled cache to a file in shared memory, so that sibling gunicorn
+    workers can hydrate from it instead of each paying their own fetch and parse on first
+    request. The numpy arrays are stored as-is and the dictionary payloads as JSON bytes.
+    The file is written to a temporary name and renamed into place, so a worker reading
+    the shared path never sees a half-written archive. Writing is best effort; a host
+    without /dev/shm just skips it.
+    """
+    temp_path = '%s.%d.tmp' % (SHM_CACHE_PATH, os.getpid())
+    try:
+        with open(temp_path, 'wb') as cache_file:
+            np.savez(cache_file,
+                     data_json=np.frombuffer(orjson.dumps(_cache['data']), dtype=np.uint8),
+                     epochs_json=np.frombuffer(_cache['epochs_json'], dtype=np.uint8),
+                     epoch_seconds=_cache['epoch_seconds'],
+                     velocities=_cache['velocities'],
+                     positions=_cache['positions'],
+                     speeds=_cache['speeds'],
+                     etag=np.array(_cache['etag'] or ''),
+                     last_modified=np.array(_cache['last_modified'] or ''))
+        os.replace(temp_path, SHM_CACHE_PATH)
+    except OSError:
+        logging.info('Unable to write shared cache file. Skipping.')
+
+def _load_shared_cache() -> bool:
+    """
+    Attempts to hydrate the cache from the shared-memory file written by another worker.
+    Only a file younger than CACHE_TTL is accepted, and the remaining TTL is carried over
+    so all workers refresh on the same schedule.
+
+    Returns:
+           loaded (bool): True when the cache was filled from the shared file.
+    """
+    try:
+        age = time.time() - os.path.getmtime(SHM_CACHE_PATH)
+        if(age >= CACHE_TTL):
+            return(False)
+        stored = np.load(SHM_CACHE_PATH, mmap_mode='r')
+        data = orjson.loads(bytes(stored['data_json']))
+        _cache['data'] = data
+        _cache['state_vectors'] = data['ndm']['oem']['body']['segment']['data']['stateVector']
+        _cache['header'] = data['ndm']['oem']['header']
+        _cache['metadata'] = data['ndm']['oem']['body']['segment']['metadata']
+        _cache['comment'] = data['ndm']['oem']['body']['segment']['data']['COMMENT']
+        _cache['epoch_seconds'] = stored['epoch_seconds']
+        _cache['epoch_to_index'] = {sv['EPOCH']: i for i, sv in enumerate(_cache['state_vectors'])}
+        _cache['velocities'] = stored['velocities']
+        _cache['positions'] = stored['positions']
+        _cache['speeds'] = stored['speeds']
+        _cache['epochs_json'] = bytes(stored['epochs_json'])
+        _cache['epochs_etag'] = hashlib.md5(_cache['epochs_json']).hexdigest()
+        _cache['etag'] = stored['etag'].item() or None
+        _cache['last_modified'] = stored['last_modified'].item() or None
+        _cache['ts'] = time.monotonic() - age
+        return(True)
+    except Exception:
+        logging.info('Unable to read shared cache file. Fetching fresh data.')
+        return(False)
 
 def get_data():
     #Typehinting seemed to break this function.
     """
     Accesses the ISS positional data from the internet, and formats it from XML into a dictionary.
+    The parsed data is held in a module-level cache for CACHE_TTL seconds, since the source file
+    only updates every few hours. Repeat calls inside that window reuse the cached dictionary
+    rather than fetching and parsing the XML all over again.
 
     Returns:
            data (List): The ISS positional data from the internet, formatted into a dictionary.
     """
+    if(_cache['data'] != None and time.monotonic() - _cache['ts'] < CACHE_TTL):
+        return(_cache['data'])
+    if(_cache['data'] == None and _load_shared_cache()):
+        return(_cache['data'])
     try:
-        response = requests.get(url='https://nasa-public-data.s3.amazonaws.com/iss-coords/current/ISS_OEM/ISS.OEM_J2K_EPH.xml')
-        data = xmltodict.parse(response.content)
+        headers = {}
+        if(_cache['etag'] != None):
+            headers['If-None-Match'] = _cache['etag']
+        if(_cache['last_modified'] != None):
+            headers['If-Modified-Since'] = _cache['last_modified']
+        response = _session.get(url=ISS_DATA_URL, headers=headers, stream=True, timeout=(3, 10))
+        if(response.status_code == 304 and _cache['data'] != None):
+            _cache['ts'] = time.monotonic()
+            return(_cache['data'])
+        response.raw.decode_content = True
+        data = _parse_oem_stream(response.raw)
+        _cache['data'] = data
+        _cache['state_vectors'] = data['ndm']['oem']['body']['segment']['data']['stateVector']
+        _cache['header'] = data['ndm']['oem']['header']
+        _cache['metadata'] = data['ndm']['oem']['body']['segment']['metadata']
+        _cache['comment'] = data['ndm']['oem']['body']['segment']['data']['COMMENT']
+        _cache['epoch_seconds'] = _epoch_strings_to_seconds([sv['EPOCH'] for sv in _cache['state_vectors']])
+        _cache['epoch_to_index'] = {sv['EPOCH']: i for i, sv in enumerate(_cache['state_vectors'])}
+        _cache['velocities'] = _extract_velocities(_cache['state_vectors'])
+        _cache['positions'] = _extract_positions(_cache['state_vectors'])
+        _cache['speeds'] = np.sqrt(np.einsum('ij,ij->i', _cache['velocities'], _cache['velocities']))
+        _cache['epochs_json'] = orjson.dumps(_cache['state_vectors'])
+        _cache['epochs_etag'] = hashlib.md5(_cache['epochs_json']).hexdigest()
+        _cache['lat'] = _cache['lon'] = _cache['alt'] = None
+        _cache['etag'] = response.headers.get('ETag')
+        _cache['last_modified'] = response.headers.get('Last-Modified')
+        _cache['ts'] = time.monotonic()
+        _save_shared_cache()
         return(data)
-    except:
+    except Exception as err:
+        if(_cache['data'] != None):
+            logging.error('Unable to refresh data from the internet. Reusing the cached data.')
+            _cache['ts'] = time.monotonic()
+            return(_cache['data'])
         logging.critical('Unable to request and load data from the internet. Ensure that the data is accessible.')
-        sys.exit(1)
+        raise RuntimeError('Unable to request and load data from the internet.') from err
+
+def get_state_vectors() -> List[dict]:
+    """
+    Returns the list of state vectors from the cached data set, refreshing the cache if it has
+    gone stale. The list is extracted once per refresh so that the routes do not have to walk
+    the nested dictionary chain on every request.
+
+    Returns:
+           state_vectors (List): The list of state vector dictionaries from the data set.
+    """
+    get_data()
+    return(_cache['state_vectors'])
+
+def get_cached_section(section_key: str):
+    """
+    Returns one of the small cached sections of the data set ('header', 'metadata', or
+    'comment'), refreshing the cache if it has gone stale. The sections are bound once per
+    refresh, so routes serving them skip the nested dictionary walk entirely.
+
+    Args:
+        section_key (str): The name of the section to return.
+
+    Returns:
+           section: The requested section of the data set.
+    """
+    get_data()
+    return(_cache[section_key])
 
 def get_comment(data: List[dict]) -> List[str]:
     """
@@ -264,6 +596,58 @@ def get_meta(data: List[dict]) -> List[dict]:
     """
     return(data['ndm']['oem']['body']['segment']['metadata'])
 
+def _compute_locations_astropy(state_vectors: List[dict], positions: np.ndarray) -> tuple:
+    """
+    Computes latitude, longitude, and altitude for every state vector in one vectorized
+    astropy call. The GCRS to ITRS transform sets up its IERS tables and rotation matrices
+    once for the whole batch, which costs about the same as transforming a single epoch,
+    so per-request location lookups reduce to an array index.
+
+    Args:
+        state_vectors (List): The state vector list whose epochs are being located.
+        positions (np.ndarray): The matching (N,3) array of cartesian positions in km.
+
+    Returns:
+           locations (tuple): Arrays of latitude (deg), longitude (deg), and altitude (km).
+    """
+    yday_times = [sv['EPOCH'].rstrip('zZ').replace('-', ':', 1).replace('T', ':', 1) for sv in state_vectors]
+    obstime = Time(yday_times, format='yday')
+    cartrep = coordinates.CartesianRepresentation(positions.T, unit=units.km)
+    gcrs = coordinates.GCRS(cartrep, obstime=obstime)
+    itrs = gcrs.transform_to(coordinates.ITRS(obstime=obstime))
+    loc = coordinates.EarthLocation(*itrs.cartesian.xyz)
+    return(loc.lat.value, loc.lon.value, loc.height.value)
+
+def _locations_for_cache() -> tuple:
+    """
+    Returns the latitude, longitude, and altitude arrays for the cached data set, computing
+    them once per cache refresh on first demand and reusing them afterwards.
+
+    Returns:
+           locations (tuple): Arrays of latitude (deg), longitude (deg), and altitude (km).
+    """
+    get_data()
+    if(_cache['lat'] is None):
+        _cache['lat'], _cache['lon'], _cache['alt'] = _compute_locations_astropy(_cache['state_vectors'], _cache['positions'])
+    return(_cache['lat'], _cache['lon'], _cache['alt'])
+
+@functools.lru_cache(maxsize=4096)
+def _reverse_geolocate(lat_q: float, lon_q: float):
+    """
+    Reverse-geocodes a quantized latitude/longitude pair through Nominatim. Results are
+    memoized on the rounded coordinates, so repeated requests for nearby positions reuse a
+    previous answer instead of paying another rate-limited network round trip. At two
+    decimal places (roughly a kilometer) the cache absorbs essentially every repeat hit.
+
+    Args:
+        lat_q (float): The latitude, rounded to two decimal places.
+        lon_q (float): The longitude, rounded to two decimal places.
+
+    Returns:
+           geo_location: The geopy location for the coordinates, or None over open water.
+    """
+    return(_geocoder.reverse((lat_q, lon_q), zoom=15, language='en'))
+
 #Following function is taken directly from slack.
 def compute_location_astropy(sv):
     x = float(sv['X']['#text'])
@@ -271,7 +655,7 @@ def compute_location_astropy(sv):
     z = float(sv['Z']['#text'])
     
     # assumes epoch is in format '2024-067T08:28:00.000Z'
-    this_epoch=time.strftime('%Y-%m-%d %H:%m:%S', time.strptime(sv['EPOCH'][:-5], '%Y-%jT%H:%M:%S'))
+    this_epoch=time.strftime('%Y-%m-%d %H:%M:%S', time.strptime(sv['EPOCH'][:-5], '%Y-%jT%H:%M:%S'))
     
     cartrep = coordinates.CartesianRepresentation([x, y, z], unit=units.km)
     gcrs = coordinates.GCRS(cartrep, obstime=this_epoch)
@@ -279,6 +663,53 @@ def compute_location_astropy(sv):
     loc = coordinates.EarthLocation(*itrs.cartesian.xyz)
     
     return loc.lat.value, loc.lon.value, loc.height.value
+def _location_fields(epoch_index: int) -> dict:
+    """
+    Builds the location portion of a response (latitude, longitude, altitude, and
+    geolocation) for the state vector at the given index of the cached data set. Shared by
+    the location and now routes so the two cannot drift apart.
+
+    Args:
+        epoch_index (int): The index of the state vector in the cached data set.
+
+    Returns:
+           fields (dict): The location fields for the requested state vector.
+    """
+    lat, lon, alt = _locations_for_cache()
+    epoch_lat = float(lat[epoch_index])
+    epoch_lon = float(lon[epoch_index])
+    epoch_alt = float(alt[epoch_index])
+
+    fields = {}
+    fields["LATITUDE"] = {"#text": epoch_lat, "@units": "deg"}
+    fields["LONGITUDE"] = {"#text": epoch_lon, "@units": "deg"}
+    fields["ALTITUDE"] = {"#text": epoch_alt, "@units": "km"}
+
+    geo_location = _reverse_geolocate(round(epoch_lat,2), round(epoch_lon,2))
+    if(geo_location == None):
+        fields["GEOLOCATION"] = "Far from any location, perhaps over an ocean."
+    else:
+        fields["GEOLOCATION"] = geo_location.raw['address']
+    return(fields)
+
+def _emit_epoch(epoch_index: int) -> dict:
+    """
+    Builds the full payload for the state vector at the given index of the cached data set:
+    the state vector itself plus its speed and location fields, all read from the
+    precomputed arrays. The state vector is copied so the cached data is never mutated.
+
+    Args:
+        epoch_index (int): The index of the state vector in the cached data set.
+
+    Returns:
+           result (dict): The complete payload for the requested state vector.
+    """
+    working_data = get_state_vectors()
+    result = dict(working_data[epoch_index])
+    result["SPEED"] = {"#text": float(_speeds_for(working_data)[epoch_index]), "@units": "km/s"}
+    result.update(_location_fields(epoch_index))
+    return(result)
+
 #Traditional typehinting does not seem to work with flask routes. I have tried to
 #offset this by defining almost all the functionality of these routes elsewhere.
 
@@ -288,10 +719,9 @@ def meta_request():
     Takes an incoming request for the metadata of the data and returns those values.
     """
     try:
-        data = get_data()
-        working_data = get_meta(data)
+        working_data = get_cached_section('metadata')
         return(working_data)
-    except:
+    except Exception:
         return("Encountered error requesting metadata. Aborting.\n")
 @app.route('/header', methods=['GET'])
 def header_request():
@@ -299,10 +729,9 @@ def header_request():
     Takes an incoming request for the header values of the data and returns those values.
     """
     try:
-        data = get_data()
-        working_data = get_header(data)
+        working_data = get_cached_section('header')
         return(working_data)
-    except:
+    except Exception:
         return("Encountered error requesting header. Aborting.\n")
 
 @app.route('/comment', methods=['GET'])
@@ -312,10 +741,9 @@ def comment_request():
     those values.
     """
     try:
-        data = get_data()
-        working_data = get_comment(data)
+        working_data = get_cached_section('comment')
         return(working_data)
-    except:
+    except Exception:
         return("Encountered error requesting comment. Aborting.\n")
 @app.route('/epochs', methods=['GET'])
 def index_request():
@@ -327,14 +755,20 @@ def index_request():
            result (List): The curated portion of the dataset.
     """
     try:
-        data = get_data()
-        working_data = data['ndm']['oem']['body']['segment']['data']['stateVector']
+        working_data = get_state_vectors()
         offset = request.args.get('offset')
         limit = request.args.get('limit')
-        
+
+        if(offset == None and limit == None and _cache['epochs_json'] != None):
+            if(request.headers.get('If-None-Match') == _cache['epochs_etag']):
+                return('', 304)
+            result = app.response_class(_cache['epochs_json'], mimetype='application/json')
+            result.headers['ETag'] = _cache['epochs_etag']
+            return(result)
+
         result = fetch_index_request(working_data, offset, limit)
         return(result)
-    except:
+    except Exception:
         return("Encountered error fetching epoch data. Aborting.\n")
     
 @app.route('/epochs/<epoch>', methods=['GET'])
@@ -348,15 +782,13 @@ def epoch_request(epoch):
            result (List): The associated data with the epoch closest to the one requested by the user.
     """
     try:
-        data = get_data()
-        working_data = data['ndm']['oem']['body']['segment']['data']['stateVector']
-        
-        result = fetch_epoch_data(working_data, epoch)
-        
-        if(result==None):
+        working_data = get_state_vectors()
+
+        epoch_index = _find_epoch_index(working_data, epoch)
+        if(epoch_index == -1):
             return("Encountered invalid epoch. Operation aborted.\n")
-        return(result)
-    except:
+        return(working_data[epoch_index])
+    except Exception:
         return("Encountered error fetching specified epoch data. Aborting.\n")
 
 @app.route('/epochs/<epoch>/speed', methods=['GET'])
@@ -370,19 +802,15 @@ def speed_request(epoch):
            result (string): The speed of the station at the requested epoch.
     """
     try:
-        data = get_data()
-        working_data = data['ndm']['oem']['body']['segment']['data']['stateVector']
-        
-        epoch_request = fetch_epoch_data(working_data, epoch)
-        if(epoch_request==[]):
+        working_data = get_state_vectors()
+
+        epoch_index = _find_epoch_index(working_data, epoch)
+        if(epoch_index == -1):
             return("Encountered invalid epoch. Operation aborted.\n")
-        
-        x_dot = float(epoch_request['X_DOT']['#text'])
-        y_dot = float(epoch_request['Y_DOT']['#text'])
-        z_dot = float(epoch_request['Z_DOT']['#text'])
-        result = cartesian_velocity_to_speed(x_dot,y_dot,z_dot)
+
+        result = float(_speeds_for(working_data)[epoch_index])
         return(str(result)+' km/s\n')
-    except:
+    except Exception:
         return("Encountered error fetching specific speed data. Aborting.\n")
 
 @app.route('/epochs/<epoch>/location', methods=['GET'])
@@ -395,33 +823,15 @@ def location_request(epoch):
            result( (List): The locational data of the request epoch.
     """
     try:
-        data = get_data()
-        working_data = data['ndm']['oem']['body']['segment']['data']['stateVector']
-        epoch_request = fetch_epoch_data(working_data, epoch)
-        
-        if(epoch_request==[]):
+        working_data = get_state_vectors()
+        epoch_index = _find_epoch_index(working_data, epoch)
+
+        if(epoch_index == -1):
             return("Encountered invalid epoch. Operation aborted.\n")
-            
-        coordinates = compute_location_astropy(epoch_request)
-        coordinate_lat = {"#text": coordinates[0], "@units": "deg"}
-        coordinate_lon = {"#text": coordinates[1], "@units": "deg"}
-        coordinate_alt = {"#text": coordinates[2], "@units": "km"}
-        
-        result = {}
-        result["LATITUDE"] = coordinate_lat
-        result["LONGITUDE"] = coordinate_lon
-        result["ALTITUDE"] = coordinate_alt
-        
-        geocoder = Nominatim(user_agent='iss_tracker')
-        geo_location = geocoder.reverse((coordinates[0],coordinates[1]), zoom=15, language='en')
-        if(geo_location)==None:
-            geo_location = "Far from any location, perhaps over an ocean."
-            result["GEOLOCATION"] = geo_location
-        else:
-            result["GEOLOCATION"] = geo_location.raw['address']
-            
+
+        result = _location_fields(epoch_index)
         return(result)
-    except:
+    except Exception:
         return("Encountered error fetching specific location data. Aborting.\n")
 @app.route('/now', methods=['GET'])
 def now_request():
@@ -433,41 +843,17 @@ def now_request():
            result (List): The associated data with the current epoch, along with its speed.
     """
     try:
-        data = get_data()
-        working_data = data['ndm']['oem']['body']['segment']['data']['stateVector']
+        working_data = get_state_vectors()
         
         current_epoch = get_workable_time()
-        
-        epoch_matched = fetch_epoch_data(working_data, current_epoch)
-        
-        x_dot = float(epoch_matched['X_DOT']['#text'])
-        y_dot = float(epoch_matched['Y_DOT']['#text'])
-        z_dot = float(epoch_matched['Z_DOT']['#text'])
-        current_speed = cartesian_velocity_to_speed(x_dot,y_dot,z_dot)
-        
-        speed_data = {"#text": current_speed, "@units": "km/s"}
-        
-        coordinates = compute_location_astropy(epoch_matched)
-        coordinate_lat = {"#text": coordinates[0], "@units": "deg"}
-        coordinate_lon = {"#text": coordinates[1], "@units": "deg"}
-        coordinate_alt = {"#text": coordinates[2], "@units": "km"}
-        
-        epoch_matched["SPEED"] = speed_data
-        epoch_matched["LATITUDE"] = coordinate_lat
-        epoch_matched["LONGITUDE"] = coordinate_lon
-        epoch_matched["ALTITUDE"] = coordinate_alt
-        
-        geocoder = Nominatim(user_agent='iss_tracker')
-        geo_location = geocoder.reverse((coordinates[0],coordinates[1]), zoom=15, language='en')
-        if(geo_location)==None:
-            geo_location = "Far from any location, perhaps over an ocean."
-            epoch_matched["GEOLOCATION"] = geo_location
-        else:
-            epoch_matched["GEOLOCATION"] = geo_location.raw['address']
-        
-        result = epoch_matched    
+
+        epoch_index = _find_epoch_index(working_data, current_epoch)
+        if(epoch_index == -1):
+            return("Encountered error fetching current epoch data. Aborting.\n")
+
+        result = _emit_epoch(epoch_index)
         return(result)
-    except:
+    except Exception:
         return("Encountered error fetching current epoch data. Aborting.\n")
 
 #Main function definition
@@ -484,7 +870,9 @@ def main():
     #--End parsing--
 
     #--Begin running--
-    app.run(debug=True, host='0.0.0.0')
+    #Development fallback only; the container runs the app under gunicorn instead,
+    #which serves concurrent requests from a shared in-process cache.
+    app.run(host='0.0.0.0')
     #--End running--
     
 #Call to main function
@@ -25,9 +25,9 @@ def test_get_capping_data(data: List[dict]) -> None:
     """
     This runs tests on the 'get_capping_data' function to ensure it returns the proper values and handles errors.
     """
-    assert get_capping_data(data, 'EPOCH') == [data['ndm']['oem']['body']['segment']['data']['stateVector'][0]['EPOCH'], data['ndm']['oem']['body']['segment']['data']['stateVector'][-1]['EPOCH']]
-    assert get_capping_data(data, 'X') == [data['ndm']['oem']['body']['segment']['data']['stateVector'][0]['X'], data['ndm']['oem']['body']['segment']['data']['stateVector'][-1]['X']]
-    assert get_capping_data(data, 'Z_DOT') == [data['ndm']['oem']['body']['segment']['data']['stateVector'][0]['Z_DOT'], data['ndm']['oem']['body']['segment']['data']['stateVector'][-1]['Z_DOT']]
+    assert get_capping_data(data, 'EPOCH') == (data['ndm']['oem']['body']['segment']['data']['stateVector'][0]['EPOCH'], data['ndm']['oem']['body']['segment']['data']['stateVector'][-1]['EPOCH'])
+    assert get_capping_data(data, 'X') == (data['ndm']['oem']['body']['segment']['data']['stateVector'][0]['X'], data['ndm']['oem']['body']['segment']['data']['stateVector'][-1]['X'])
+    assert get_capping_data(data, 'Z_DOT') == (data['ndm']['oem']['body']['segment']['data']['stateVector'][0]['Z_DOT'], data['ndm']['oem']['body']['segment']['data']['stateVector'][-1]['Z_DOT'])
 
 def test_convert_iso_dis_8601() -> None:
     """
@@ -58,7 +58,7 @@ def test_fetch_index_request(data: List[dict]) -> None:
     working_data = data['ndm']['oem']['body']['segment']['data']['stateVector']
     assert fetch_index_request(working_data) == working_data
     assert fetch_index_request(working_data, 'apple', [0,2,3,4]) == working_data
-    assert fetch_index_request(working_data, 4, 900) == working_data[4:900]
+    assert fetch_index_request(working_data, 4, 900) == working_data[4:904]
     assert fetch_index_request(working_data, 'four', 900) == working_data[:900]
     assert fetch_index_request(working_data, 9999999) == []
     assert fetch_index_request(working_data, 0, 99999999) == working_data